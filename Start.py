@@ -1,53 +1,305 @@
 #!/usr/bin/env python3
 import sys
 import os
-import platform
-import subprocess
-import shutil
-from pathlib import Path
+import hashlib
 
 # List of required packages for the Tkinter GUI version.
 REQUIREMENTS = [
     "youtube-transcript-api",
     "python-docx>=1.1.0",
-    "requests>=2.31.0"
+    "requests>=2.31.0",
+    "orjson>=3.9.0"
 ]
 
+_IS_WINDOWS = sys.platform.startswith("win")
+
+def _venv_exe(name):
+    """Return the path of an executable inside the venv for the current platform."""
+    suffix = ".exe" if _IS_WINDOWS else ""
+    subdir = "Scripts" if _IS_WINDOWS else "bin"
+    return os.path.join("venv", subdir, name + suffix)
+
+_PY_EXE = _venv_exe("python")
+_PIP_EXE = _venv_exe("pip")
+
+# The venv's own config; it also records which requirements were installed into it.
+PYVENV_CFG = os.path.join("venv", "pyvenv.cfg")
+
+# Remembers where wkhtmltopdf was found, keyed by a hash of PATH.
+TOOL_CACHE = ".yttp_cache.json"
+
+# Optional prebuilt venv; extracting it replaces venv creation and dependency install.
+VENV_ARCHIVE = "venv.tar.zst"
+
+# Fully pinned, hash-checked resolution of REQUIREMENTS; regenerate it after editing the list.
+REQUIREMENTS_LOCK = "requirements.lock"
+
+# Wheels fetched by the pip fallback, one subdirectory per locked package.
+WHEEL_CACHE = "wheel_cache"
+
+# Keep pip from checking PyPI for its own updates or loading its prompt machinery.
+PIP_QUIET_FLAGS = ["--disable-pip-version-check", "--no-input", "-q"]
+
+# Project-local pip cache, reused across runs so repeat installs skip the network.
+PIP_CACHE = ".pipcache"
+
 def validate_python():
-    """Ensure Python 3.7+ is used."""
-    if sys.version_info < (3, 7):
-        print("\n[ERROR] Python 3.7+ is required.")
+    """Ensure Python 3.10+ is used; the oldest interpreter the pins in requirements.lock install on."""
+    if sys.version_info < (3, 10):
+        print("\n[ERROR] Python 3.10+ is required.")
         sys.exit(1)
 
+def bootstrap_venv_from_archive():
+    """Extract a prebuilt venv from VENV_ARCHIVE, if one ships next to Start.py.
+
+    The archive must be built against the same base interpreter location, since
+    pyvenv.cfg's home and the interpreter symlink are left untouched.
+    """
+    import shutil
+    import subprocess
+
+    if os.path.exists("venv") or not os.path.exists(VENV_ARCHIVE):
+        return
+    print("[INFO] Extracting prebuilt virtual environment...")
+    try:
+        subprocess.run(["tar", "--zstd", "-xf", VENV_ARCHIVE], check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"\n[WARNING] Could not extract {VENV_ARCHIVE}: {e}")
+        # A half-extracted venv would make create_venv() skip creation on every launch
+        shutil.rmtree("venv", ignore_errors=True)
+        return
+    relocate_venv_scripts()
+
+def archived_venv_path(activate):
+    """Return the path the venv was built at: from pyvenv.cfg, else the activate script."""
+    import re
+
+    recorded = read_pyvenv_value("venv_path")
+    if recorded:
+        return recorded
+    try:
+        with open(activate) as f:
+            text = f.read()
+    except FileNotFoundError:
+        return ""
+    # Only a plain assignment; newer templates also carry VIRTUAL_ENV=$(cygpath "...") for MSYS
+    match = re.search(r"""^\s*@?(?:export\s+|set\s+"?)?VIRTUAL_ENV=(["']?)([^"'$\r\n]+)\1"?\s*$""", text, re.M)
+    return match.group(2) if match else ""
+
+def relocate_venv_scripts():
+    """Rewrite the build path embedded in activate scripts and console-script shebangs."""
+    import re
+
+    bin_dir = os.path.dirname(_PY_EXE)
+    activate = os.path.join(bin_dir, "activate.bat" if _IS_WINDOWS else "activate")
+    old_path = archived_venv_path(activate)
+    new_path = os.path.abspath("venv")
+    if not old_path or old_path == new_path:
+        return
+    # Whole-path matches only, so /build/venv doesn't also hit /build/venv2
+    pattern = re.compile(re.escape(old_path.encode()) + rb"(?![\w.-])")
+    new_bytes = new_path.encode()
+    for name in os.listdir(bin_dir):
+        path = os.path.join(bin_dir, name)
+        if os.path.islink(path) or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        if b"\0" in data:
+            continue
+        updated = pattern.sub(lambda _: new_bytes, data)
+        if updated != data:
+            with open(path, "wb") as f:
+                f.write(updated)
+    write_pyvenv_value("venv_path", new_path)
+
 def create_venv():
     """Create a virtual environment in the local 'venv' directory if it doesn't exist."""
-    venv_dir = Path("venv")
-    if venv_dir.exists():
+    import shutil
+    import venv
+
+    if os.path.exists("venv"):
         print("[INFO] Virtual environment already exists. Skipping creation.")
     else:
         try:
             print("[INFO] Creating virtual environment...")
-            subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
+            # Build the venv in this process rather than spawning "python -m venv".
+            # uv installs into a bare venv, so skip the slow ensurepip step when it is available.
+            # On POSIX, link the interpreter instead of copying it.
+            builder = venv.EnvBuilder(with_pip=not shutil.which("uv"), symlinks=not _IS_WINDOWS)
+            builder.create("venv")
+            # Remembered so a venv archived from here can be relocated on extraction
+            write_pyvenv_value("venv_path", os.path.abspath("venv"))
             print("[INFO] Virtual environment created successfully.")
         except Exception as e:
             print(f"\n[ERROR] Failed to create virtual environment: {e}")
             sys.exit(1)
 
+def requirements_hash():
+    """Return a digest of REQUIREMENTS and the lock file, used to detect changes."""
+    hasher = hashlib.sha256("\n".join(sorted(REQUIREMENTS)).encode())
+    with open(REQUIREMENTS_LOCK, "rb") as f:
+        hasher.update(f.read())
+    return hasher.hexdigest()
+
+def read_pyvenv_value(key):
+    """Return a value from the venv's pyvenv.cfg, or "" if the file or key is absent."""
+    try:
+        with open(PYVENV_CFG) as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return ""
+    for line in lines:
+        name, _, value = line.partition("=")
+        if name.strip() == key:
+            return value.strip()
+    return ""
+
+def write_pyvenv_value(key, value):
+    """Set a value in the venv's pyvenv.cfg, replacing any previous one."""
+    with open(PYVENV_CFG) as f:
+        lines = [line for line in f.read().splitlines() if line.partition("=")[0].strip() != key]
+    lines.append(f"{key} = {value}")
+    with open(PYVENV_CFG, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+def record_requirements_hash():
+    """Store the current requirements hash in pyvenv.cfg, replacing any previous value."""
+    write_pyvenv_value("requirements_hash", requirements_hash())
+
+def venv_site_packages():
+    """Return the venv's site-packages directory without starting its interpreter."""
+    if _IS_WINDOWS:
+        return os.path.join("venv", "Lib", "site-packages")
+    version = read_pyvenv_value("version") or read_pyvenv_value("version_info")
+    major_minor = ".".join(version.split(".")[:2])
+    return os.path.join("venv", "lib", f"python{major_minor}", "site-packages")
+
+def dependencies_satisfied():
+    """Check the recorded hash, then the venv's package metadata, before falling back to an install."""
+    recorded = read_pyvenv_value("requirements_hash")
+    if recorded:
+        # A different hash means REQUIREMENTS or the lock changed since the last install
+        return recorded == requirements_hash()
+    # No record (e.g. an extracted archive): accept the venv only if it holds exactly the locked pins
+    from importlib.metadata import Distribution
+
+    search_path = [venv_site_packages()]
+    for entry in read_lock_entries():
+        name, _, version = entry.split()[0].partition("==")
+        dist = next(iter(Distribution.discover(name=name, path=search_path)), None)
+        if dist is None or dist.version != version:
+            return False
+    record_requirements_hash()
+    return True
+
+def read_lock_entries():
+    """Return each package of the lock file as a single requirement line with its hashes."""
+    entries = []
+    current = ""
+    with open(REQUIREMENTS_LOCK) as f:
+        lines = f.read().splitlines()
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        current += " " + line.rstrip("\\").strip()
+        if not line.endswith("\\"):
+            entries.append(current.strip())
+            current = ""
+    return entries
+
+def pip_install_parallel(pip_exe):
+    """Download every locked package concurrently, then install offline from the local wheels."""
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
+    entries = read_lock_entries()
+    env = dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK="1")
+    dest_dirs = [os.path.join(WHEEL_CACHE, str(i)) for i in range(len(entries))]
+
+    def download(job):
+        index, entry = job
+        # Hashes are only accepted in requirement files, so give each package its own.
+        os.makedirs(WHEEL_CACHE, exist_ok=True)
+        req_file = os.path.join(WHEEL_CACHE, f"{index}.txt")
+        with open(req_file, "w") as f:
+            f.write(entry + "\n")
+        subprocess.run(
+            [pip_exe, "download"] + PIP_QUIET_FLAGS
+            + [f"--cache-dir={PIP_CACHE}", "--no-deps", "--require-hashes",
+               "--only-binary=:all:", "-d", dest_dirs[index], "-r", req_file],
+            check=True,
+            env=env,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(8, len(entries))) as pool:
+        list(pool.map(download, enumerate(entries)))
+    find_links = []
+    for dest in dest_dirs:
+        find_links += ["--find-links", dest]
+    subprocess.run(
+        [pip_exe, "install"] + PIP_QUIET_FLAGS
+        + [f"--cache-dir={PIP_CACHE}", "--no-index"] + find_links
+        + ["--no-deps", "--require-hashes", "--only-binary=:all:", "-r", REQUIREMENTS_LOCK],
+        check=True,
+        env=env,
+    )
+
 def install_dependencies():
     """Install required packages into the virtual environment (if not already installed)."""
-    is_windows = platform.system() == "Windows"
-    pip_exe = Path("venv") / ("Scripts" if is_windows else "bin") / ("pip.exe" if is_windows else "pip")
-    print("[INFO] Installing dependencies (if not already installed)...")
+    import shutil
+    import subprocess
+
+    python_exe, pip_exe = _PY_EXE, _PIP_EXE
+    if dependencies_satisfied():
+        print("[INFO] Dependencies already satisfied. Skipping installation.")
+        return
+    # Prefer uv when it is on PATH; it resolves and downloads in parallel.
+    uv_exe = shutil.which("uv")
     try:
-        subprocess.run([str(pip_exe), "install"] + REQUIREMENTS, check=True)
+        if uv_exe:
+            print("[INFO] Installing dependencies with uv (if not already installed)...")
+            subprocess.run(
+                [uv_exe, "pip", "install", "--python", python_exe, "--compile-bytecode",
+                 "--no-deps", "--require-hashes", "--only-binary=:all:", "-r", REQUIREMENTS_LOCK],
+                check=True,
+            )
+        else:
+            print("[INFO] Installing dependencies (if not already installed)...")
+            if not os.path.exists(pip_exe):
+                # The venv was created --without-pip for uv, but uv is no longer on PATH.
+                subprocess.run([python_exe, "-m", "ensurepip"], check=True)
+            pip_install_parallel(pip_exe)
+        record_requirements_hash()
         print("[INFO] Dependencies installed successfully.")
     except subprocess.CalledProcessError:
         print("\n[ERROR] Dependency installation failed.")
         sys.exit(1)
 
+def find_wkhtmltopdf():
+    """Return the wkhtmltopdf path, reusing the cached lookup while PATH is unchanged."""
+    import json
+    import shutil
+
+    path_hash = hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()
+    try:
+        with open(TOOL_CACHE) as f:
+            cached = json.load(f)
+    except (FileNotFoundError, ValueError):
+        cached = {}
+    cached_path = cached.get("wkhtmltopdf")
+    if cached.get("path_hash") == path_hash and cached_path and os.path.exists(cached_path):
+        return cached_path
+    found = shutil.which("wkhtmltopdf")
+    if found:
+        with open(TOOL_CACHE, "w") as f:
+            json.dump({"wkhtmltopdf": os.path.abspath(found), "path_hash": path_hash}, f)
+    return found
+
 def check_wkhtmltopdf():
     """Warn if wkhtmltopdf is not found (PDF export will be disabled)."""
-    if not shutil.which("wkhtmltopdf"):
+    if not find_wkhtmltopdf():
         print("\n[WARNING] wkhtmltopdf not found – PDF export will be disabled.")
         print("Installation instructions:")
         print("  Windows: https://wkhtmltopdf.org/downloads.html")
@@ -58,21 +310,26 @@ def check_wkhtmltopdf():
 
 def launch_app():
     """Launch the main Tkinter GUI application using the virtual environment."""
-    is_windows = platform.system() == "Windows"
-    python_exe = Path("venv") / ("Scripts" if is_windows else "bin") / ("python.exe" if is_windows else "python")
+    python_exe = _PY_EXE
     print("[INFO] Launching GUI application...")
+    # Replace this process with the app instead of keeping Start.py resident as a parent.
+    sys.stdout.flush()
     try:
-        subprocess.run([str(python_exe), "main.py"], check=True)
-    except KeyboardInterrupt:
-        print("\n[INFO] User terminated the application.")
+        os.execv(python_exe, [python_exe, "main.py"])
     except Exception as e:
         print(f"\n[ERROR] Failed to launch the application: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
+    import threading
+
     validate_python()
+    # The wkhtmltopdf lookup is independent of the venv, so run it alongside setup.
+    wkhtmltopdf_check = threading.Thread(target=check_wkhtmltopdf)
+    wkhtmltopdf_check.start()
+    bootstrap_venv_from_archive()
     create_venv()
     install_dependencies()
-    check_wkhtmltopdf()
+    wkhtmltopdf_check.join()
     print("\n[INFO] Environment ready! Launching application...\n")
     launch_app()
@@ -15,26 +15,35 @@ Features:
   - Cool startup splash animation
   - "Typewriter" effect for chunk response text display
   - Automatic retry on transcript extraction failure
-  - Temporary files are cleared after saving, canceling, or backing out
+  - Temporary files and held results are cleared after saving, canceling, or backing out
   - Cross-platform (Windows, macOS, Linux)
   - DOCX title feature with centered filename
   - Sequential processing with typewriter effect per chunk
   - Enhanced settings options
   - Improved settings UI with tabs
   - Typewriter speed control
+  - Concurrent chunk processing with a configurable request limit
 """
 
 import os
 import sys
 import json
+import re
 import time
 import shutil
+import tempfile
 import threading
+import queue
 import requests
-import itertools
+import orjson
+from collections.abc import MutableMapping
+from concurrent.futures import Future
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from tkinter import (
     Tk,
+    TclError,
     Frame,
     Text,
     Scrollbar,
@@ -61,41 +70,41 @@ from tkinter.ttk import (
     Notebook,
 )
 from tkinter.filedialog import asksaveasfilename
-from youtube_transcript_api import (
-    YouTubeTranscriptApi,
-    NoTranscriptFound,
-    TranscriptsDisabled,
-    VideoUnavailable,
-)
-from docx import Document
-from docx.shared import Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from tkinter.scrolledtext import ScrolledText
 
 # -------------------------
 # Helper: read_file_with_fallback
 # -------------------------
 def read_file_with_fallback(filepath):
-    encodings = ["utf-8", "latin1", "iso-8859-1"]
-    for enc in encodings:
-        try:
-            with open(filepath, "r", encoding=enc) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            continue
-    raise UnicodeDecodeError(f"Could not decode file {filepath} with available encodings.")
+    # Read once and decode the buffer; latin1 maps every byte, so it cannot fail
+    data = Path(filepath).read_bytes()
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("latin1")
 
 
 # -------------------------
 # Ollama API Helper Function
 # -------------------------
-def generate_response(prompt, model, host="http://localhost:11434", cancel_event=None):
+# One keep-alive session shared by every chunk request, sized for concurrent chunks
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.5)),
+)
+_OLLAMA_TIMEOUT = (5, 120)  # (connect, read) seconds
+
+
+def generate_response(prompt, model, host="http://localhost:11434", cancel_event=None, on_token=None):
     url = f"{host}/api/generate"
-    payload = {"model": model, "prompt": prompt, "stream": False}
-    headers = {"Content-Type": "application/json"}
+    payload = {"model": model, "prompt": prompt, "stream": on_token is not None}
     try:
         if cancel_event and cancel_event.is_set():
             return "[Generation cancelled]", None
-        response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=30)
+        if on_token is not None:
+            return _stream_response(url, payload, on_token, cancel_event)
+        response = _SESSION.post(url, json=payload, timeout=_OLLAMA_TIMEOUT)
         if cancel_event and cancel_event.is_set():
             return "[Generation cancelled]", None
         response.raise_for_status()
@@ -104,7 +113,7 @@ def generate_response(prompt, model, host="http://localhost:11434", cancel_event
         except json.JSONDecodeError:
             # Retry once if empty response
             time.sleep(1)
-            response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=30)
+            response = _SESSION.post(url, json=payload, timeout=_OLLAMA_TIMEOUT)
             response.raise_for_status()
             json_response = response.json()
         generated_text = json_response.get("response", "").strip()
@@ -116,15 +125,123 @@ def generate_response(prompt, model, host="http://localhost:11434", cancel_event
         return f"[Error processing chunk: {e}]", None
 
 
+def _stream_response(url, payload, on_token, cancel_event=None):
+    # Ollama streams one JSON object per line; hand each token on as soon as it arrives
+    parts = []
+    json_response = None
+    with _SESSION.post(url, json=payload, timeout=_OLLAMA_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if cancel_event and cancel_event.is_set():
+                return "[Generation cancelled]", None
+            if not line:
+                continue
+            json_response = json.loads(line)
+            if "error" in json_response:
+                raise RuntimeError(json_response["error"])
+            token = json_response.get("response", "")
+            if token:
+                parts.append(token)
+                on_token(token)
+            if json_response.get("done"):
+                break
+    if json_response is None:
+        return "[Unable to fetch transcript or response is empty]", None
+    return "".join(parts).strip(), json_response
+
+
+class DaemonThreadPool:
+    """Minimal executor whose workers are daemon threads.
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so a request blocked on
+    Ollama (up to the read timeout) would keep the process alive after the window closes.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix="worker"):
+        self._queue = queue.SimpleQueue()
+        self._threads = []
+        self._max_workers = max_workers
+        self._prefix = thread_name_prefix
+        self._shutdown = False
+
+    def submit(self, fn, *args):
+        if self._shutdown:
+            raise RuntimeError("cannot submit after shutdown")
+        future = Future()
+        self._queue.put((future, fn, args))
+        if len(self._threads) < self._max_workers:
+            thread = threading.Thread(
+                target=self._work, name=f"{self._prefix}_{len(self._threads)}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        return future
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, cancel_futures=False):
+        # Never waits: queued work either still runs (default) or is cancelled
+        self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in self._threads:
+            self._queue.put(None)
+
+
 # -------------------------
 # Configuration
 # -------------------------
+class Settings(MutableMapping):
+    """Settings dict that notes whether anything changed since it was last saved."""
+
+    def __init__(self, data):
+        self._data = dict(data)
+        self.dirty = False
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        if key not in self._data or self._data[key] != value:
+            self._data[key] = value
+            self.dirty = True
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self.dirty = True
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
 class Config:
     def __init__(self):
         self.base_dir = Path(__file__).parent
         self.config_file = self.base_dir / "config.json"
         self.output_dir = self.base_dir / "outputs"
         self.temp_dir = self.base_dir / "temp"
+        self._last_bytes = None  # what config.json holds, as far as this process knows
+        self._pending_clean = None  # (widget, after id) of a deferred clean_temp
         self._init_directories()
         self.settings = self._load_config()
 
@@ -150,93 +267,159 @@ class Config:
             "custom_title": "",
             "retry_count": 3,
             "typewriter_speed": 2,  # ms per character
+            "parallel_requests": 4,  # concurrent Ollama requests (see OLLAMA_NUM_PARALLEL)
+            "batch_size": 1,  # chunks sent together in one prompt
+            "persist_debug": False,  # also write the raw chunks to temp/yt_chunks
+            "persist_chunks": False,  # also write each processed chunk to temp/yt_pro
         }
         try:
-            with open(self.config_file, "r") as f:
-                return {**defaults, **json.load(f)}
+            self._last_bytes = self.config_file.read_bytes()
+            return Settings({**defaults, **orjson.loads(self._last_bytes)})
         except FileNotFoundError:
-            return defaults
+            return Settings(defaults)
 
     def save_config(self):
-        with open(self.config_file, "w") as f:
-            json.dump(self.settings, f, indent=2)
+        if not self.settings.dirty:
+            return
+        # Write a sibling file and swap it in, so config.json is never left half-written.
+        # No fsync: settings are cheap to recreate, and a sync would stall every Save click.
+        # The flag is cleared before the snapshot so a change made meanwhile (saves also come from
+        # the transcript worker) marks it again; a failed write restores it below.
+        self.settings.dirty = False
+        data = orjson.dumps(dict(self.settings), option=orjson.OPT_INDENT_2)
+        # A Save that re-enters the current values serializes to the same bytes; skip the rewrite
+        if data == self._last_bytes:
+            return
+        tmp_path = None
+        try:
+            # A unique temp name per save, so the Tk thread and the worker never share one
+            with tempfile.NamedTemporaryFile(dir=self.base_dir, prefix="config.", suffix=".tmp", delete=False) as tmp:
+                tmp_path = tmp.name
+                tmp.write(data)
+            os.replace(tmp_path, self.config_file)
+        except OSError:
+            self.settings.dirty = True
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self._last_bytes = data
 
     def clean_temp(self):
+        # Drop each folder wholesale and recreate it empty, instead of unlinking file by file
         for subdir in ["yt_trans", "yt_chunks", "yt_pro"]:
             dir_path = self.temp_dir / subdir
-            for item in dir_path.glob("*"):
-                if item.is_file():
-                    item.unlink()
+            shutil.rmtree(dir_path, ignore_errors=True)
+            dir_path.mkdir(parents=True, exist_ok=True)
+
+    def schedule_clean_temp(self, widget, delay=250):
+        # UI handlers often fire together (save, then back); fold them into one clean on the Tk loop
+        if self._pending_clean is not None:
+            pending_widget, after_id = self._pending_clean
+            pending_widget.after_cancel(after_id)
+        self._pending_clean = (widget, widget.after(delay, self._do_clean_temp))
+
+    def flush_clean_temp(self):
+        # Run a deferred clean now, before a new run starts writing into the temp folder
+        if self._pending_clean is not None:
+            pending_widget, after_id = self._pending_clean
+            pending_widget.after_cancel(after_id)
+            self._do_clean_temp()
+
+    def _do_clean_temp(self):
+        self._pending_clean = None
+        self.clean_temp()
 
 
 # -------------------------
 # Transcript Handling
 # -------------------------
+# Video ID from watch (?v= / &v=), youtu.be, shorts and embed URLs
+_VID_RE = re.compile(r"(?:v=|youtu\.be/|/shorts/|/embed/)([A-Za-z0-9_-]{11})")
+
+# Keep-alive session for YouTube, shared by the transcript library's requests and across retries
+_YT_SESSION = requests.Session()
+_YT_SESSION.mount("https://", HTTPAdapter())
+
+
 class TranscriptHandler:
     def __init__(self, config: Config):
         self.config = config
         self.config.clean_temp()
+        self._yt_api = None
+        self.chunk_names = []  # file names of the current run's chunks, in order
+
+    def fetch_transcript(self, video_id):
+        # Imported on first use so the library isn't loaded before the splash screen
+        from youtube_transcript_api import YouTubeTranscriptApi
+
+        if self._yt_api is None:
+            try:
+                self._yt_api = YouTubeTranscriptApi(http_client=_YT_SESSION)
+            except TypeError:
+                # youtube-transcript-api < 1.0 only has the classmethod interface
+                return YouTubeTranscriptApi.get_transcript(video_id)
+        return self._yt_api.fetch(video_id).to_raw_data()
 
     def extract_and_save_transcript(self, video_url):
+        # Transient failures (connection errors, 429 and 5xx) are retried with exponential backoff
+        # at the HTTP layer; a video without a usable transcript fails straight away
+        from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, VideoUnavailable
+
         retry_count = int(self.config.settings.get("retry_count", 3))
-        retry_delay = 1  # seconds between retries
-        
-        for attempt in range(retry_count + 1):
-            try:
-                if "youtu.be" in video_url:
-                    video_id = video_url.split("/")[-1]
-                else:
-                    video_id = video_url.split("v=")[-1].split("&")[0]
-                transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
-                transcript_text = "\n".join([entry["text"] for entry in transcript_list])
-                trans_dir = self.config.temp_dir / "yt_trans"
-                transcript_file = trans_dir / f"{video_id}_transcript.txt"
-                transcript_file.write_text(transcript_text, encoding="utf-8")
-                self.config.settings["last_video_id"] = video_id
-                self.config.save_config()
-                return transcript_file, video_id
-            except (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable):
-                if attempt < retry_count:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
-                raise RuntimeError("Transcript unavailable for this video.")
-            except Exception as e:
-                msg = str(e)
-                if attempt < retry_count:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
-                if "no element found" in msg:
-                    raise RuntimeError("Unable to fetch transcript; it may be unavailable or malformed.")
-                raise RuntimeError(f"Error extracting transcript: {e}")
+        _YT_SESSION.get_adapter("https://").max_retries = Retry(
+            total=retry_count,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None,  # the InnerTube player lookup is a POST
+            raise_on_status=False,
+        )
+        try:
+            match = _VID_RE.search(video_url)
+            video_id = match.group(1) if match else video_url.rsplit("/", 1)[-1][:11]
+            transcript_list = self.fetch_transcript(video_id)
+            transcript_text = "\n".join([entry["text"] for entry in transcript_list])
+            trans_dir = self.config.temp_dir / "yt_trans"
+            transcript_file = trans_dir / f"{video_id}_transcript.txt"
+            transcript_file.write_text(transcript_text, encoding="utf-8")
+            self.config.settings["last_video_id"] = video_id
+            self.config.save_config()
+            return transcript_file, video_id
+        except (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable):
+            raise RuntimeError("Transcript unavailable for this video.")
+        except Exception as e:
+            if "no element found" in str(e):
+                raise RuntimeError("Unable to fetch transcript; it may be unavailable or malformed.")
+            raise RuntimeError(f"Error extracting transcript: {e}")
+
+    def _persist(self, setting, subdir, index, text):
+        # Chunks live in memory; on-disk copies are only written when `setting` is enabled
+        if self.config.settings.get(setting, False):
+            (self.config.temp_dir / subdir / self.chunk_names[index]).write_bytes(text.encode("utf-8"))
 
     def split_transcript(self, transcript_file):
         try:
             chunk_size = int(self.config.settings.get("chunk_size", 300))
             chunk_overlap = int(self.config.settings.get("chunk_overlap", 50))
             content = transcript_file.read_text(encoding="utf-8")
-            words = content.split()
-            total_words = len(words)
-            chunks_dir = self.config.temp_dir / "yt_chunks"
-            chunk_files = []
+            # Word boundaries as character offsets, so each chunk is one slice of the original text
+            spans = [m.span() for m in re.finditer(r"\S+", content)]
+            total_words = len(spans)
+            chunk_texts = []
+            self.chunk_names = []
             start = 0
-            chunk_id = 1
             while start < total_words:
                 end = min(start + chunk_size, total_words)
-                chunk_text = " ".join(words[start:end])
-                chunk_file = chunks_dir / f"chunk_{chunk_id}.txt"
-                chunk_file.write_text(chunk_text, encoding="utf-8")
-                chunk_files.append(chunk_file)
+                chunk_text = content[spans[start][0]:spans[end - 1][1]]
+                self.chunk_names.append(f"chunk_{len(chunk_texts) + 1}.txt")
+                self._persist("persist_debug", "yt_chunks", len(chunk_texts), chunk_text)
+                chunk_texts.append(chunk_text)
                 start += chunk_size - chunk_overlap
-                chunk_id += 1
-            return chunk_files
+            return chunk_texts
         except Exception as e:
             raise RuntimeError(f"Error splitting transcript: {e}")
 
-    def process_single_chunk(self, chunk_file, cancel_event=None):
+    def process_single_chunk(self, index, chunk_content, cancel_event=None, on_token=None):
         try:
-            chunk_content = chunk_file.read_text(encoding="utf-8")
             processing_prompt = self.config.settings.get(
                 "processing_prompt",
                 "Check and reformat the text for grammar, clarity, and proper structure.",
@@ -249,26 +432,105 @@ class TranscriptHandler:
                 combined_prompt,
                 self.config.settings.get("ollama_model", "deepseek-r1"),
                 cancel_event=cancel_event,
+                on_token=on_token,
             )
-            
-            # Save the processed chunk to yt_pro folder
-            output_dir = self.config.temp_dir / "yt_pro"
-            output_dir.mkdir(exist_ok=True)  # Ensure directory exists
-            output_file = output_dir / chunk_file.name
-            output_file.write_text(generated_text, encoding="utf-8")
-            
-            return generated_text
+            self._persist("persist_chunks", "yt_pro", index, generated_text)
+            return index, generated_text
         except Exception as e:
-            return f"[Error processing chunk: {e}]"
+            return index, f"[Error processing chunk: {e}]"
 
-    def combine_chunks_to_output(self, video_id, status_callback=None):
+    def process_chunk_batch(self, start, chunk_texts, cancel_event=None, on_token=None):
+        # Only a lone chunk is streamed; a batched reply is split apart once it is complete
+        if len(chunk_texts) == 1:
+            return [self.process_single_chunk(start, chunk_texts[0], cancel_event=cancel_event, on_token=on_token)[1]]
+        try:
+            processing_prompt = self.config.settings.get(
+                "processing_prompt",
+                "Check and reformat the text for grammar, clarity, and proper structure.",
+            )
+            # One prompt for the whole batch, so the shared instruction is only sent once
+            sections = "\n\n".join(
+                f"###CHUNK {i}###\n{chunk_text}" for i, chunk_text in enumerate(chunk_texts, start=1)
+            )
+            combined_prompt = (
+                f"Processing Instruction:\n{processing_prompt}\n\n"
+                f"Apply the above instruction separately to each of the {len(chunk_texts)} texts below. "
+                f"Return each result under its own ###CHUNK n### marker, in the same order, "
+                f"with nothing before the first marker.\n\n{sections}"
+            )
+            generated_text, json_response = generate_response(
+                combined_prompt,
+                self.config.settings.get("ollama_model", "deepseek-r1"),
+                cancel_event=cancel_event,
+            )
+            parts = re.split(r"###CHUNK (\d+)###", generated_text)
+            results = {int(num): text.strip() for num, text in zip(parts[1::2], parts[2::2])}
+        except Exception:
+            json_response, results = None, {}
+
+        # Fall back to one request per chunk if the reply can't be split back apart
+        if json_response is None or sorted(results) != list(range(1, len(chunk_texts) + 1)):
+            return [
+                self.process_single_chunk(start + offset, chunk_text, cancel_event=cancel_event)[1]
+                for offset, chunk_text in enumerate(chunk_texts)
+            ]
+
+        texts = [results[i] for i in range(1, len(chunk_texts) + 1)]
+        for offset, text in enumerate(texts):
+            self._persist("persist_chunks", "yt_pro", start + offset, text)
+        return texts
+
+    def submit_chunks(self, executor, chunk_texts, on_result=None, cancel_event=None, on_token=None):
+        # Queue every batch on the executor, whose worker count bounds the requests in flight.
+        # on_result(index, text) fires from a worker thread as each batch finishes.
+        batch_size = max(1, int(self.config.settings.get("batch_size", 1)))
+        futures = []
+        for start in range(0, len(chunk_texts), batch_size):
+            batch = chunk_texts[start:start + batch_size]
+            stream = (lambda token, start=start: on_token(start, token)) if on_token else None
+            future = executor.submit(self.process_chunk_batch, start, batch, cancel_event, stream)
+            if on_result:
+                future.add_done_callback(
+                    lambda f, start=start, count=len(batch): self._report_batch(f, start, count, on_result)
+                )
+            futures.append(future)
+        return futures
+
+    @staticmethod
+    def _report_batch(future, start, count, on_result):
+        if future.cancelled():
+            return  # dropped from the queue by a cancel; nothing was generated
+        try:
+            texts = future.result()
+        except Exception as e:
+            texts = [f"[Error processing chunk: {e}]"] * count
+        for offset, text in enumerate(texts):
+            on_result(start + offset, text)
+
+    def combine_chunks_to_output(self, video_id, status_callback=None, background=False):
+        # Fallback for runs whose results were persisted to the temp folder.
+        # Walk the run's chunk names in order; a sorted glob would put chunk_10 before chunk_2
         processed_dir = self.config.temp_dir / "yt_pro"
-        processed_files = sorted(processed_dir.glob("*.txt"))
+        processed_files = [
+            path for path in (processed_dir / name for name in self.chunk_names) if path.is_file()
+        ]
         if not processed_files:
             if status_callback:
                 status_callback("Error: No processed chunks to combine.", "error")
-            return
+            return False
+        # Files are read one at a time as they are written out
+        texts = (read_file_with_fallback(f) for f in processed_files)
+        return self._save_combined(texts, video_id, status_callback, background)
+
+    def combine_chunks_from_memory(self, chunks, video_id, status_callback=None, background=False):
+        # The usual path: the processed chunks the processing view already holds, no disk reads
+        if not chunks:
+            if status_callback:
+                status_callback("Error: No processed chunks to combine.", "error")
+            return False
+        return self._save_combined(chunks, video_id, status_callback, background)
 
+    def _save_combined(self, texts, video_id, status_callback, background):
         if self.config.settings.get("skip_manual_name", False):
             default_name = video_id
         else:
@@ -286,14 +548,33 @@ class TranscriptHandler:
         if not save_path:
             if status_callback:
                 status_callback("Save cancelled by user.", "error")
-            return
+            return False
+
+        if background:
+            # The dialog above needs the Tk thread; the write itself doesn't
+            threading.Thread(
+                target=self.write_output, args=(save_path, texts, status_callback), daemon=True
+            ).start()
+        else:
+            self.write_output(save_path, texts, status_callback)
+        return True  # a write was started; with background=True it may still be running
 
+    def write_output(self, save_path, texts, status_callback=None):
         try:
             if save_path.lower().endswith(".txt"):
-                combined_text = "\n\n".join([read_file_with_fallback(f) for f in processed_files])
-                with open(save_path, "w", encoding="utf-8") as f:
-                    f.write(combined_text)
+                # Write piece by piece instead of joining everything into one more string first
+                with open(save_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    for i, content in enumerate(texts):
+                        if i:
+                            f.write("\n\n")
+                        f.write(content)
             else:
+                # python-docx pulls in lxml; only load it when a DOCX is actually written
+                from docx import Document
+                from docx.shared import Pt
+                from docx.enum.text import WD_ALIGN_PARAGRAPH
+                from docx.oxml import OxmlElement
+
                 doc = Document()
                 
                 # Add title if enabled
@@ -314,11 +595,14 @@ class TranscriptHandler:
                     # Add space after title
                     doc.add_paragraph()
                 
-                # Add processed content
-                for file in processed_files:
-                    content = read_file_with_fallback(file)
-                    doc.add_paragraph(content)
-                    doc.add_paragraph()
+                # Add processed content: build the <w:p> elements directly and slot them in before
+                # the section properties, rather than going through add_paragraph for each one
+                sect_pr = doc.element.body.sectPr
+                for content in texts:
+                    para = OxmlElement("w:p")
+                    para.add_r().text = content  # run text setter turns \n and \t into w:br / w:tab
+                    sect_pr.addprevious(para)
+                    sect_pr.addprevious(OxmlElement("w:p"))
                 doc.save(save_path)
             if status_callback:
                 status_callback(f"Success: File saved at {save_path}", "success")
@@ -337,15 +621,23 @@ class YTTPApp:
         self.root.geometry("800x600")
         self.root.minsize(700, 550)
         self.root.configure(bg="#1e1e2e")
+        # The title-bar close button stops a run and cleans up just like Exit
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_application)
 
         # Animation settings
         self.title_colors = ["#e0e0e0", "#b5b5e5", "#8a8acf", "#5f5fba"]
         self.title_color_index = 0
+        self.title_after_id = None
+        self.current_frame = None
 
         # Initialize config and handler
         self.config = Config()
         self.handler = TranscriptHandler(self.config)
 
+        # Worker pool for Ollama requests, sized by the parallel_requests setting
+        self.executor = None
+        self.executor_size = 0
+
         # Style configuration
         self.style = Style()
         self.style.theme_use("clam")
@@ -424,26 +716,45 @@ class YTTPApp:
             self.frames[F.__name__] = frame
             frame.grid(row=0, column=0, sticky=N + S + E + W)
 
-        # Show the splash frame initially
+        # Show the splash frame initially; this also starts the title animation
         self.show_frame("SplashFrame")
 
-        # Start title animation (for frames that show Title)
-        self.animate_title()
-
         # Configure container grid to expand
         self.container.rowconfigure(0, weight=1)
         self.container.columnconfigure(0, weight=1)
 
+    # Frames with a "Title.TLabel"; the color cycle only runs while one of them is raised
+    TITLE_FRAMES = ("SplashFrame", "MenuFrame", "SettingsFrame")
+
     def show_frame(self, frame_name):
         frame = self.frames[frame_name]
+        if frame_name == "SettingsFrame":
+            frame.refresh_from_config()
         frame.tkraise()
+        self.current_frame = frame_name
+        if frame_name in self.TITLE_FRAMES:
+            if self.title_after_id is None:
+                self.animate_title()
+        elif self.title_after_id is not None:
+            self.root.after_cancel(self.title_after_id)
+            self.title_after_id = None
 
     def animate_title(self):
         # Cycle through title colors for frames with "Title.TLabel"
         self.title_color_index = (self.title_color_index + 1) % len(self.title_colors)
         self.style.configure("Title.TLabel", foreground=self.title_colors[self.title_color_index])
         # Repeat every 500ms
-        self.root.after(500, self.animate_title)
+        self.title_after_id = self.root.after(500, self.animate_title)
+
+    def get_executor(self):
+        # Recreate the pool if parallel_requests changed; the old one finishes its queued work
+        size = max(1, int(self.config.settings.get("parallel_requests", 4)))
+        if self.executor is None or size != self.executor_size:
+            if self.executor is not None:
+                self.executor.shutdown()
+            self.executor = DaemonThreadPool(max_workers=size, thread_name_prefix="ollama")
+            self.executor_size = size
+        return self.executor
 
     def start_processing_thread(self, video_url):
         frame = self.frames["ProcessingFrame"]
@@ -454,6 +765,14 @@ class YTTPApp:
         frame.combine_output()
 
     def exit_application(self):
+        self.frames["ProcessingFrame"].stop_run()
+        # Queued batches never start; one still waiting on Ollama runs on a daemon thread
+        # and is abandoned when the interpreter exits
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+        _SESSION.close()
+        _YT_SESSION.close()
+        # Immediate; a deferred clean still pending dies with the root window
         self.config.clean_temp()
         self.root.destroy()
 
@@ -585,11 +904,12 @@ class StartFrame(Frame):
             self.error_label.config(text="Error: Invalid YouTube URL format.")
             return
         self.error_label.config(text="")
+        self.controller.config.flush_clean_temp()
         self.controller.show_frame("ProcessingFrame")
         threading.Thread(target=self.controller.start_processing_thread, args=(url,), daemon=True).start()
 
     def back_to_menu(self):
-        self.controller.config.clean_temp()
+        self.controller.config.schedule_clean_temp(self)
         self.controller.show_frame("MenuFrame")
 
 
@@ -597,16 +917,34 @@ class StartFrame(Frame):
 # Processing Frame
 # -------------------------
 class ProcessingFrame(Frame):
+    # Typewriter ticks are ~one frame at 60 fps; each inserts as many characters as the speed allows
+    TICK_MS = 16
+    # see(END) forces a relayout, so follow the end at most this often (seconds) while text streams in
+    SEE_INTERVAL = 4 * TICK_MS / 1000
+    SPINNER_FRAMES = "◐◓◑◒"
+
     def __init__(self, parent, controller: YTTPApp):
         super().__init__(parent, bg="#1e1e2e")
         self.controller = controller
         self.cancel_event = threading.Event()
+        self._futures = []  # the current run's queued/in-flight batches
+        self._combining = False  # an output file is being written; Combine and Menu > Output share this
         self.current_chunk_index = 0
         self.total_chunks = 0
-        self.chunk_files = []
+        self.chunk_texts = []
+        self.chunk_results = {}
+        self.chunk_streams = {}
+        self.completed_chunks = 0
+        self.run_id = 0
         self.video_id = ""
         self.display_text = ""
         self.display_index = 0
+        self.spinner_active = False
+        self._spin_i = 0
+        self._spin_after = None
+        self._last_see = 0.0
+        self._tw_after_id = None
+        self._tw_speed = int(controller.config.settings.get("typewriter_speed", 2))
 
         # Status and spinner
         top_frame = Frame(self, bg="#1e1e2e")
@@ -639,6 +977,8 @@ class ProcessingFrame(Frame):
             height=15,  # Fixed height
         )
         self.response_text.pack(fill=BOTH, expand=True)
+        # Read-only to the user; only unlocked while a run is writing into it
+        self.response_text.configure(state="disabled")
         scrollbar.config(command=self.response_text.yview)
 
         # Footer bar: filename entry and buttons
@@ -650,13 +990,13 @@ class ProcessingFrame(Frame):
         self.out_filename_entry = TEntry(footer_frame, textvariable=self.out_filename_var, width=25, justify=CENTER)
         self.out_filename_entry.grid(row=0, column=1, padx=(0, 10), sticky=W)
 
-        combine_btn = TButton(
+        self.combine_btn = TButton(
             footer_frame,
             text="Combine",
             width=12,
             command=self.combine_output,
         )
-        combine_btn.grid(row=0, column=2, padx=10)
+        self.combine_btn.grid(row=0, column=2, padx=10)
 
         cancel_btn = TButton(
             footer_frame,
@@ -685,11 +1025,23 @@ class ProcessingFrame(Frame):
 
     def start_processing(self, video_url):
         # Reset state
-        self.cancel_event.clear()
+        self.cancel_typewriter()
+        # A fresh event per run: batches of a cancelled run still waiting in the shared pool keep
+        # seeing theirs set and return without calling Ollama
+        self.cancel_event = threading.Event()
+        self.run_id += 1
+        # This runs on its own thread; a Cancel meanwhile retires run_id and sets this run's event
+        run_id, cancel_event = self.run_id, self.cancel_event
         self.current_chunk_index = 0
+        self.chunk_results = {}
+        self.chunk_streams = {}
+        self.completed_chunks = 0
+        self._tw_speed = int(self.controller.config.settings.get("typewriter_speed", 2))
         self.display_text = ""
         self.display_index = 0
+        self.response_text.configure(state="normal")
         self.response_text.delete(1.0, END)
+        self.response_text.configure(state="disabled")
         self.progress_bar["value"] = 0
         self.progress_label.config(text="Processing: 0/0")
         self.status_label.config(text="", foreground="#ffffff")
@@ -697,13 +1049,12 @@ class ProcessingFrame(Frame):
 
         # Step 1: Extract transcript with retry loop
         while True:
-            if self.cancel_event.is_set():
+            if cancel_event.is_set():
                 self.status_label.config(text="Extraction cancelled.", foreground="#ff7373")
                 self.controller.config.clean_temp()
                 return
             try:
                 transcript_file, video_id = self.controller.handler.extract_and_save_transcript(video_url)
-                self.video_id = video_id
                 break
             except RuntimeError as e:
                 msg = str(e)
@@ -717,23 +1068,38 @@ class ProcessingFrame(Frame):
                     self.controller.config.clean_temp()
                     return
 
+        if run_id != self.run_id or cancel_event.is_set():
+            return  # cancelled during the download; the view has already been cleared
+        self.video_id = video_id
+
         # Step 2: Split transcript
         try:
-            self.chunk_files = self.controller.handler.split_transcript(transcript_file)
-            self.total_chunks = len(self.chunk_files)
-            self.progress_bar["maximum"] = 100
-            self.progress_label.config(text=f"Processing: 0/{self.total_chunks}")
+            chunk_texts = self.controller.handler.split_transcript(transcript_file)
         except Exception as e:
             self.status_label.config(text=f"Error splitting transcript: {e}", foreground="#ff7373")
             self.controller.config.clean_temp()
             return
+        if run_id != self.run_id or cancel_event.is_set():
+            return  # leave the chunk list alone; a newer run may already own it
+        self.chunk_texts = chunk_texts
+        self.total_chunks = len(chunk_texts)
+        self.progress_bar["maximum"] = 100
+        self.progress_label.config(text=f"Processing: 0/{self.total_chunks}")
+
+        if self.total_chunks == 0:
+            self.process_next_chunk()
+            return
 
-        # Start processing first chunk
-        self.process_next_chunk()
+        # Step 3: Process chunks concurrently; on_chunk_done displays them in order as they arrive
+        self.start_spinner()
+        self.submit_chunks(run_id, cancel_event)
 
     def process_next_chunk(self):
         if self.current_chunk_index >= self.total_chunks or self.cancel_event.is_set():
             # Processing complete
+            self.response_text.configure(state="disabled")
+            self.spinner_active = False
+            self.spinner_label.config(text="")
             if not self.cancel_event.is_set():
                 self.status_label.config(text="Processing complete. Enter filename and press Combine.", foreground="#b5e0a8")
                 self.out_filename_var.set(self.video_id)
@@ -741,100 +1107,239 @@ class ProcessingFrame(Frame):
                 self.controller.config.save_config()
             return
 
-        # Update progress
-        self.progress_label.config(text=f"Processing: {self.current_chunk_index+1}/{self.total_chunks}")
-        self.progress_bar["value"] = int(((self.current_chunk_index+1) / self.total_chunks) * 100)
-        
-        # Animate spinner
-        spinner = itertools.cycle(["◐", "◓", "◑", "◒"])
-        self.animate_spinner(spinner)
-        
-        # Start processing this chunk in a separate thread
-        chunk_file = self.chunk_files[self.current_chunk_index]
-        threading.Thread(
-            target=self.process_chunk_in_thread, 
-            args=(chunk_file,),
-            daemon=True
-        ).start()
-
-    def animate_spinner(self, spinner):
-        if self.cancel_event.is_set():
+        # Wait until this chunk starts streaming or its result arrives; on_chunk_token/on_chunk_done resume the display
+        generated_text = self.chunk_results.get(self.current_chunk_index)
+        if generated_text is None:
+            tokens = self.chunk_streams.get(self.current_chunk_index)
+            generated_text = "".join(tokens) if tokens is not None else None
+        if generated_text is None:
+            return
+
+        # Prepare to display
+        header = f"\n--- Chunk {self.current_chunk_index+1} Response ---\n\n"
+        self.display_text = header + generated_text
+        self.display_index = 0
+
+        # Start typewriter effect; the widget stays writable for the whole chunk, not toggled per insert
+        self.response_text.configure(state="normal")
+        self.typewriter_effect()
+
+    def start_spinner(self):
+        # One ticker for the life of the frame; a restart while it is still running just keeps it going
+        self.spinner_active = True
+        if self._spin_after is None:
+            self.animate_spinner()
+
+    def animate_spinner(self):
+        if not self.spinner_active or self.cancel_event.is_set() or self.current_chunk_index >= self.total_chunks:
+            self.spinner_active = False
+            self._spin_after = None
             self.spinner_label.config(text="")
             return
-            
-        symbol = next(spinner)
-        self.spinner_label.config(text=symbol)
-        self.after(100, lambda: self.animate_spinner(spinner))
 
-    def process_chunk_in_thread(self, chunk_file):
-        try:
-            # Process the chunk
-            generated_text = self.controller.handler.process_single_chunk(
-                chunk_file, 
-                cancel_event=self.cancel_event
-            )
-            
-            # Prepare to display
-            header = f"\n--- Chunk {self.current_chunk_index+1} Response ---\n\n"
-            self.display_text = header + generated_text
-            self.display_index = 0
-            
-            # Start typewriter effect
-            self.after(0, self.typewriter_effect)
-        except Exception as e:
-            self.after(0, lambda: self.status_label.config(
-                text=f"Error processing chunk: {e}", 
-                foreground="#ff7373"
-            ))
+        self.spinner_label.config(text=self.SPINNER_FRAMES[self._spin_i])
+        self._spin_i = (self._spin_i + 1) % len(self.SPINNER_FRAMES)
+        self._spin_after = self.after(100, self.animate_spinner)
+
+    def submit_chunks(self, run_id, cancel_event):
+        # Results and tokens arrive on worker threads; hand them to the Tk loop. Once the run is
+        # stopped nothing is handed over, since the root may already be destroyed
+
+        def on_result(index, text):
+            if not cancel_event.is_set():
+                self.after(0, self.on_chunk_done, run_id, index, text)
+
+        def on_token(index, token):
+            if not cancel_event.is_set():
+                self.after(0, self.on_chunk_token, run_id, index, token)
+
+        self._futures = self.controller.handler.submit_chunks(
+            self.controller.get_executor(),
+            self.chunk_texts,
+            on_result=on_result,
+            cancel_event=cancel_event,
+            on_token=on_token,
+        )
+
+    def on_chunk_done(self, run_id, index, text):
+        # Ignore late results from a run that was cancelled or restarted
+        if run_id != self.run_id:
+            return
+        tokens = self.chunk_streams.get(index)
+        streamed = "".join(tokens) if tokens is not None else None
+        self.chunk_results[index] = text
+        self.completed_chunks += 1
+        self.progress_label.config(text=f"Processing: {self.completed_chunks}/{self.total_chunks}")
+        self.progress_bar["value"] = int((self.completed_chunks / self.total_chunks) * 100)
+        # Resume the display if it was waiting on this chunk
+        if index == self.current_chunk_index and not self.display_text:
+            self.process_next_chunk()
+        elif index == self.current_chunk_index and streamed is not None and text != streamed.strip():
+            # The stream broke off (error or cancel); show why after what arrived
+            self.display_text += f"\n{text}"
+
+    def on_chunk_token(self, run_id, index, token):
+        if run_id != self.run_id:
+            return
+        # Collect tokens as-is; rebuilding the whole string per token would copy it every time
+        self.chunk_streams.setdefault(index, []).append(token)
+        if index != self.current_chunk_index:
+            return
+        if self.display_text:
+            self.display_text += token
+        else:
+            self.process_next_chunk()
 
     def typewriter_effect(self):
-        if self.display_index < len(self.display_text) and not self.cancel_event.is_set():
-            char = self.display_text[self.display_index]
-            self.response_text.insert(END, char)
-            self.response_text.see(END)
-            self.display_index += 1
-            
-            # Get typewriter speed from settings
-            speed = int(self.controller.config.settings.get("typewriter_speed", 2))
-            self.after(speed, self.typewriter_effect)  # Use configurable delay
+        self._tw_after_id = None
+        if self.cancel_event.is_set():
+            self.response_text.configure(state="disabled")
+            self.spinner_label.config(text="")
+            return
+        streaming = self.current_chunk_index not in self.chunk_results
+        if self.display_index >= len(self.display_text) and streaming:
+            # Caught up with the stream; check again for more tokens shortly
+            self.follow_end()
+            self._tw_after_id = self.after(50, self.typewriter_effect)
+            return
+        if self.display_index < len(self.display_text):
+            speed = self._tw_speed
+            if speed <= 0:
+                # Typewriter off: everything received so far goes in with one insert
+                self._flush_remaining()
+                self._tw_after_id = self.after_idle(self.typewriter_effect)
+                return
+
+            # Typewriter speed stays in ms per character: fit as many characters into a tick as that allows
+            batch = max(1, self.TICK_MS // max(speed, 1))
+            piece = self.display_text[self.display_index:self.display_index + batch]
+            self.response_text.insert(END, piece)
+            self.display_index += len(piece)
+
+            self.follow_end()
+            self._tw_after_id = self.after(max(self.TICK_MS, speed * len(piece)), self.typewriter_effect)
         else:
             # Move to next chunk after display completes
-            self.spinner_label.config(text="")
+            self.follow_end(force=True)
+            self.display_text = ""
+            self.display_index = 0
             self.current_chunk_index += 1
             self.process_next_chunk()
 
+    def _flush_remaining(self):
+        # Push whatever the typewriter has not drawn yet for this chunk as a single insert
+        tail = self.display_text[self.display_index:]
+        if tail:
+            self.response_text.insert(END, tail)
+            self.display_index = len(self.display_text)
+            self.follow_end()
+
+    def follow_end(self, force=False):
+        now = time.monotonic()
+        if force or now - self._last_see >= self.SEE_INTERVAL:
+            self.response_text.see(END)
+            self._last_see = now
+
     def combine_output(self):
+        if self._combining:
+            return
         # Save inline output name to config
         self.controller.config.settings["inline_output_name"] = self.out_filename_var.get().strip()
         self.controller.config.save_config()
+        # Finish drawing the chunk on screen in one go rather than letting it trickle behind the save dialog
+        self._flush_remaining()
+
+        run_id = self.run_id
 
         def status_callback(msg, level):
             color = "#b5e0a8" if level == "success" else "#ff7373"
             self.status_label.config(text=msg, foreground=color)
-            # After saving, clear temp
-            self.controller.config.clean_temp()
+            self._combining = False
+            self.combine_btn.state(["!disabled"])
+            # Clear only once the file is saved, and only if no new run started meanwhile;
+            # a cancelled or failed save can be retried
+            if level == "success" and run_id == self.run_id:
+                self.clear_results()
+
+        # The file is written on a worker thread; refuse another combine until it reports back
+        self._combining = True
+        self.combine_btn.state(["disabled"])
+        on_status = lambda msg, level: self.after(0, status_callback, msg, level)
+        if self.chunk_results:
+            chunks = [self.chunk_results[i] for i in sorted(self.chunk_results)]
+            self.controller.handler.combine_chunks_from_memory(
+                chunks, self.video_id, status_callback=on_status, background=True
+            )
+        else:
+            self.controller.handler.combine_chunks_to_output(
+                self.video_id, status_callback=on_status, background=True
+            )
 
-        self.controller.handler.combine_chunks_to_output(self.video_id, status_callback=status_callback)
+    def cancel_typewriter(self):
+        # Drop the pending typewriter tick so nothing more is drawn after a cancel. That tick was
+        # the only way back to read-only mid-chunk, so lock the box here
+        if self._tw_after_id is not None:
+            self.after_cancel(self._tw_after_id)
+            self._tw_after_id = None
+        self.response_text.configure(state="disabled")
+
+    def stop_run(self):
+        # Signal the running batches and drop the ones not started, so a new run isn't queued behind them.
+        # Bumping run_id makes on_chunk_done/on_chunk_token ignore anything still on its way
+        self.run_id += 1
+        self.cancel_event.set()
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
 
     def cancel_processing(self):
-        self.cancel_event.set()
+        self.stop_run()
+        self.cancel_typewriter()
         self.status_label.config(text="Cancelling...", foreground="#ff7373")
-        self.after(500, lambda: self._back_and_clear())
+        # No fixed wait for workers: stop_run() retired this run_id, so late results are dropped,
+        # and the temp cleanup itself is already deferred
+        self.after_idle(self._back_and_clear)
 
     def back_to_menu(self):
-        self.cancel_event.set()
-        self.controller.config.clean_temp()
+        self.stop_run()
+        self.cancel_typewriter()
+        self.clear_results()
         self.controller.show_frame("MenuFrame")
 
     def _back_and_clear(self):
-        self.controller.config.clean_temp()
+        self.clear_results()
         self.controller.show_frame("MenuFrame")
 
+    def clear_results(self):
+        # Results now live here rather than only in temp; drop both so a later Output
+        # can't save a cancelled or already-saved run
+        self.chunk_results = {}
+        self.chunk_streams = {}
+        self.video_id = ""
+        self.controller.config.schedule_clean_temp(self)
+
 
 # -------------------------
 # Settings Frame with Tabs
 # -------------------------
 class SettingsFrame(Frame):
+    # (setting, attribute holding its Tk variable, variable type, label used in errors).
+    # The processing prompt is not listed: it lives in a Text widget, not a Tk variable.
+    FIELDS = (
+        ("chunk_size", "_v_chunk_size", IntVar, "Chunk Size"),
+        ("chunk_overlap", "_v_chunk_overlap", IntVar, "Chunk Overlap"),
+        ("retry_count", "_v_retry_count", IntVar, "Retry Count"),
+        ("ollama_model", "_v_ollama_model", StringVar, "Ollama Model"),
+        ("parallel_requests", "_v_parallel_requests", IntVar, "Parallel Requests"),
+        ("batch_size", "_v_batch_size", IntVar, "Chunks per Request"),
+        ("output_format", "_v_output_format", StringVar, "Output Format"),
+        ("skip_manual_name", "_v_skip_manual_name", BooleanVar, "Skip Manual Naming"),
+        ("include_docx_title", "_v_include_docx_title", BooleanVar, "Include Title in DOCX"),
+        ("title_font_size", "_v_title_font_size", IntVar, "Title Font Size"),
+        ("custom_title", "_v_custom_title", StringVar, "Custom Title"),
+        ("typewriter_speed", "_v_typewriter_speed", IntVar, "Typewriter Speed"),
+    )
+
     def __init__(self, parent, controller: YTTPApp):
         super().__init__(parent, bg="#1e1e2e")
         self.controller = controller
@@ -844,6 +1349,7 @@ class SettingsFrame(Frame):
 
         # Create notebook (tabbed interface)
         notebook = Notebook(self, style="TNotebook")
+        self.notebook = notebook
         notebook.pack(fill=BOTH, expand=True, padx=20, pady=(0, 20))
         
         # Create tabs
@@ -856,19 +1362,9 @@ class SettingsFrame(Frame):
         notebook.add(output_tab, text="Output Settings")
         
         # Variables
-        self.vars = {
-            "chunk_size": IntVar(value=controller.config.settings.get("chunk_size", 300)),
-            "chunk_overlap": IntVar(value=controller.config.settings.get("chunk_overlap", 50)),
-            "retry_count": IntVar(value=controller.config.settings.get("retry_count", 3)),
-            "ollama_model": StringVar(value=controller.config.settings.get("ollama_model", "deepseek-r1")),
-            "processing_prompt": StringVar(value=controller.config.settings.get("processing_prompt", "")),
-            "output_format": StringVar(value=controller.config.settings.get("output_format", "docx")),
-            "skip_manual_name": BooleanVar(value=controller.config.settings.get("skip_manual_name", False)),
-            "include_docx_title": BooleanVar(value=controller.config.settings.get("include_docx_title", True)),
-            "title_font_size": IntVar(value=controller.config.settings.get("title_font_size", 16)),
-            "custom_title": StringVar(value=controller.config.settings.get("custom_title", "")),
-            "typewriter_speed": IntVar(value=controller.config.settings.get("typewriter_speed", 2)),
-        }
+        settings = controller.config.settings
+        for key, attr, var_type, _ in self.FIELDS:
+            setattr(self, attr, var_type(value=settings[key]))
         
         # Configure grid for tabs
         for tab in [chunk_tab, processing_tab, output_tab]:
@@ -877,14 +1373,17 @@ class SettingsFrame(Frame):
             tab.columnconfigure(2, weight=1)
             tab.rowconfigure(0, weight=1)
         
-        # Chunk Settings Tab
-        self.create_chunk_settings(chunk_tab)
-        
-        # Processing Settings Tab
-        self.create_processing_settings(processing_tab)
-        
-        # Output Settings Tab
-        self.create_output_settings(output_tab)
+        # Tab contents are built the first time each tab is selected; the Tk variables above
+        # hold the values meanwhile, so unbuilt tabs still save correctly
+        self.processing_prompt_widget = None
+        self._prompt_loaded = None
+        self._tab_builders = {
+            str(chunk_tab): self.create_chunk_settings,
+            str(processing_tab): self.create_processing_settings,
+            str(output_tab): self.create_output_settings,
+        }
+        self.build_tab(chunk_tab)
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self.build_tab(notebook.select()))
         
         # Status label and buttons
         self.status_label = TLabel(self, text="", style="TLabel")
@@ -910,21 +1409,50 @@ class SettingsFrame(Frame):
         )
         back_btn.grid(row=0, column=1, padx=10)
 
+    def refresh_from_config(self):
+        # The frame and its Tk variables are built once; reopening it just reloads the saved values
+        settings = self.controller.config.settings
+        for key, attr, _, _ in self.FIELDS:
+            getattr(self, attr).set(settings[key])
+        self.load_prompt(settings["processing_prompt"])
+
+    def build_tab(self, tab):
+        builder = self._tab_builders.pop(str(tab), None)
+        if builder is not None:
+            builder(self.nametowidget(tab))
+
+    def load_prompt(self, prompt):
+        # Only touch the Text widget when the saved prompt changed or the user typed in it;
+        # before the Processing tab is built there is no widget yet
+        widget = self.processing_prompt_widget
+        if widget is None:
+            return
+        if prompt == self._prompt_loaded and not widget.edit_modified():
+            return
+        widget.delete("1.0", END)
+        widget.insert("1.0", prompt)
+        widget.edit_modified(False)
+        self._prompt_loaded = prompt
+
+    def _label(self, parent, text, row):
+        TLabel(parent, text=text, style="TLabel").grid(row=row, column=0, padx=10, pady=10, sticky=W)
+
+    def _row(self, parent, text, var, row, width=10, columnspan=1):
+        # Label in column 0, entry beside it; the layout every plain setting uses
+        self._label(parent, text, row)
+        entry = TEntry(parent, textvariable=var, width=width)
+        entry.grid(row=row, column=1, columnspan=columnspan, padx=10, pady=10, sticky=W)
+        return entry
+
     def create_chunk_settings(self, parent):
         # Chunk size
-        TLabel(parent, text="Chunk Size:", style="TLabel").grid(row=0, column=0, padx=10, pady=10, sticky=W)
-        chunk_size_entry = TEntry(parent, textvariable=self.vars["chunk_size"], width=10)
-        chunk_size_entry.grid(row=0, column=1, padx=10, pady=10, sticky=W)
+        self._row(parent, "Chunk Size:", self._v_chunk_size, 0)
         
         # Chunk overlap
-        TLabel(parent, text="Chunk Overlap:", style="TLabel").grid(row=1, column=0, padx=10, pady=10, sticky=W)
-        chunk_overlap_entry = TEntry(parent, textvariable=self.vars["chunk_overlap"], width=10)
-        chunk_overlap_entry.grid(row=1, column=1, padx=10, pady=10, sticky=W)
+        self._row(parent, "Chunk Overlap:", self._v_chunk_overlap, 1)
         
         # Retry count
-        TLabel(parent, text="Retry Count:", style="TLabel").grid(row=2, column=0, padx=10, pady=10, sticky=W)
-        retry_entry = TEntry(parent, textvariable=self.vars["retry_count"], width=10)
-        retry_entry.grid(row=2, column=1, padx=10, pady=10, sticky=W)
+        self._row(parent, "Retry Count:", self._v_retry_count, 2)
         
         # Description
         desc = TLabel(parent, text="Chunk size and overlap are in words. Retry count is for transcript extraction.", 
@@ -933,13 +1461,11 @@ class SettingsFrame(Frame):
 
     def create_processing_settings(self, parent):
         # Ollama model
-        TLabel(parent, text="Ollama Model:", style="TLabel").grid(row=0, column=0, padx=10, pady=10, sticky=W)
-        ollama_model_entry = TEntry(parent, textvariable=self.vars["ollama_model"], width=30)
-        ollama_model_entry.grid(row=0, column=1, columnspan=2, padx=10, pady=10, sticky=W)
+        self._row(parent, "Ollama Model:", self._v_ollama_model, 0, width=30, columnspan=2)
         
         # Processing prompt
-        TLabel(parent, text="Processing Prompt:", style="TLabel").grid(row=1, column=0, padx=10, pady=10, sticky=W)
-        processing_prompt_entry = Text(
+        self._label(parent, "Processing Prompt:", 1)
+        processing_prompt_entry = ScrolledText(
             parent, 
             width=40, 
             height=6,
@@ -950,20 +1476,28 @@ class SettingsFrame(Frame):
             wrap="word"
         )
         processing_prompt_entry.grid(row=1, column=1, columnspan=2, padx=10, pady=10, sticky=W)
-        processing_prompt_entry.insert("1.0", self.vars["processing_prompt"].get())
         self.processing_prompt_widget = processing_prompt_entry
+        self.load_prompt(self.controller.config.settings["processing_prompt"])
+        
+        # Parallel requests
+        self._row(parent, "Parallel Requests:", self._v_parallel_requests, 2)
+        
+        # Chunks per request
+        self._row(parent, "Chunks per Request:", self._v_batch_size, 3)
         
         # Description
-        desc = TLabel(parent, text="This prompt will be sent to Ollama with each chunk of text.", 
+        desc = TLabel(parent, text="This prompt will be sent to Ollama with each chunk of text.\n"
+                                   "Parallel requests above 1 need OLLAMA_NUM_PARALLEL set on the Ollama server.\n"
+                                   "Chunks per request above 1 sends several chunks in one prompt.", 
                      style="TLabel", foreground="#a0a0c0", font=("Segoe UI", 10))
-        desc.grid(row=2, column=0, columnspan=3, padx=10, pady=(20, 10), sticky=W)
+        desc.grid(row=4, column=0, columnspan=3, padx=10, pady=(20, 10), sticky=W)
 
     def create_output_settings(self, parent):
         # Output format
-        TLabel(parent, text="Output Format:", style="TLabel").grid(row=0, column=0, padx=10, pady=10, sticky=W)
+        self._label(parent, "Output Format:", 0)
         output_format_combo = Combobox(
             parent,
-            textvariable=self.vars["output_format"],
+            textvariable=self._v_output_format,
             values=["docx", "txt"],
             state="readonly",
             width=10,
@@ -974,7 +1508,7 @@ class SettingsFrame(Frame):
         skip_check = TCheckbutton(
             parent,
             text="Skip Manual Naming",
-            variable=self.vars["skip_manual_name"],
+            variable=self._v_skip_manual_name,
             style="TCheckbutton",
         )
         skip_check.grid(row=1, column=0, padx=10, pady=10, sticky=W)
@@ -983,58 +1517,53 @@ class SettingsFrame(Frame):
         title_check = TCheckbutton(
             parent,
             text="Include Title in DOCX",
-            variable=self.vars["include_docx_title"],
+            variable=self._v_include_docx_title,
             style="TCheckbutton",
         )
         title_check.grid(row=1, column=1, padx=10, pady=10, sticky=W)
         
         # Title font size
-        TLabel(parent, text="Title Font Size:", style="TLabel").grid(row=2, column=0, padx=10, pady=10, sticky=W)
-        title_size_entry = TEntry(parent, textvariable=self.vars["title_font_size"], width=10)
-        title_size_entry.grid(row=2, column=1, padx=10, pady=10, sticky=W)
+        self._row(parent, "Title Font Size:", self._v_title_font_size, 2)
         
         # Custom title
-        TLabel(parent, text="Custom Title:", style="TLabel").grid(row=3, column=0, padx=10, pady=10, sticky=W)
-        custom_title_entry = TEntry(parent, textvariable=self.vars["custom_title"], width=30)
-        custom_title_entry.grid(row=3, column=1, columnspan=2, padx=10, pady=10, sticky=W)
+        self._row(parent, "Custom Title:", self._v_custom_title, 3, width=30, columnspan=2)
         
         # Typewriter speed
-        TLabel(parent, text="Typewriter Speed (ms):", style="TLabel").grid(row=4, column=0, padx=10, pady=10, sticky=W)
-        speed_entry = TEntry(parent, textvariable=self.vars["typewriter_speed"], width=10)
-        speed_entry.grid(row=4, column=1, padx=10, pady=10, sticky=W)
+        self._row(parent, "Typewriter Speed (ms):", self._v_typewriter_speed, 4)
         
         # Description
-        desc = TLabel(parent, text="Leave custom title blank to use filename as title.", 
+        desc = TLabel(parent, text="Leave custom title blank to use filename as title.\n"
+                           "Set typewriter speed to 0 to show responses instantly.", 
                      style="TLabel", foreground="#a0a0c0", font=("Segoe UI", 10))
         desc.grid(row=5, column=0, columnspan=3, padx=10, pady=(20, 10), sticky=W)
 
     def on_save(self):
-        try:
-            self.controller.config.settings["chunk_size"] = int(self.vars["chunk_size"].get())
-            self.controller.config.settings["chunk_overlap"] = int(self.vars["chunk_overlap"].get())
-            self.controller.config.settings["retry_count"] = int(self.vars["retry_count"].get())
-            self.controller.config.settings["ollama_model"] = self.vars["ollama_model"].get().strip()
-            
-            # Get processing prompt from text widget
+        # One pass reads and validates every field; IntVar.get() raises TclError on text that isn't a number
+        updates = {}
+        for key, attr, _, label in self.FIELDS:
+            try:
+                value = getattr(self, attr).get()
+            except (ValueError, TclError):
+                self.status_label.config(text=f"Error: {label} must be an integer.", foreground="#ff7373")
+                return
+            updates[key] = value.strip() if isinstance(value, str) else value
+
+        # Get processing prompt from text widget, only reading it back if it was edited
+        if self.processing_prompt_widget is not None and self.processing_prompt_widget.edit_modified():
             proc_prompt = self.processing_prompt_widget.get("1.0", END).strip()
             if proc_prompt:
-                self.controller.config.settings["processing_prompt"] = proc_prompt
-                
-            self.controller.config.settings["output_format"] = self.vars["output_format"].get()
-            self.controller.config.settings["skip_manual_name"] = self.vars["skip_manual_name"].get()
-            self.controller.config.settings["include_docx_title"] = self.vars["include_docx_title"].get()
-            self.controller.config.settings["title_font_size"] = int(self.vars["title_font_size"].get())
-            self.controller.config.settings["custom_title"] = self.vars["custom_title"].get().strip()
-            self.controller.config.settings["typewriter_speed"] = int(self.vars["typewriter_speed"].get())
-            
-            self.controller.config.save_config()
-            self.status_label.config(text="Settings saved successfully.", foreground="#b5e0a8")
-            self.controller.config.clean_temp()
-        except ValueError:
-            self.status_label.config(text="Error: Numeric values must be integers.", foreground="#ff7373")
+                updates["processing_prompt"] = proc_prompt
+
+        # Nothing is applied until everything parsed; Settings only marks itself dirty for values
+        # that differ, so an unchanged save writes nothing
+        self.controller.config.settings.update(updates)
+        self.controller.config.save_config()
+        self.controller.frames["ProcessingFrame"]._tw_speed = self.controller.config.settings["typewriter_speed"]
+        self.status_label.config(text="Settings saved successfully.", foreground="#b5e0a8")
+        self.controller.config.schedule_clean_temp(self)
 
     def back_to_menu(self):
-        self.controller.config.clean_temp()
+        self.controller.config.schedule_clean_temp(self)
         self.controller.show_frame("MenuFrame")
 
 